@@ -1,13 +1,13 @@
-import kiteapp as kt
-import pandas as pd
+import time
+_import_started = time.perf_counter()
 from time import sleep
 import datetime
+import math
 import threading
 from flask import Flask, jsonify, render_template_string, request
-from instruments import get_nifty_weekly_options
-import greeks_calculator 
 import traceback
-import numpy as np
+# kiteapp (kiteconnect), instruments (pandas) and greeks_calculator (numpy) are imported
+# by warm_up() so importing this module stays fast and free of side effects
 
 ENCTOKEN_FILE = "enctoken.txt"
 USER_ID = "ABC012"
@@ -15,28 +15,27 @@ API_KEY = "kite"
 NIFTY_INDEX_TOKEN = 256265
 DEFAULT_NUM_STRIKES_EACH_SIDE = 8
 DEFAULT_MODE = 'ltpoi' 
+MAX_STRIKES_EACH_SIDE = 50
+QUOTE_POLL_INTERVAL = 2 # seconds between REST refreshes while the ticker is down
+QUOTE_REFRESH_BUDGET = 1.0 # seconds, for one REST refresh of the polled window
+IMPORT_TIME_BUDGET = 0.5 # seconds, checked at launch
 
 option_chain_display_data = {}
 nifty_spot_ltp = None
 instrument_details_map = {} 
 data_lock = threading.Lock()
 subscribed_tokens_global_list = []
+ticker_connected = threading.Event()
+last_quote_refresh_seconds = None
+app_status = 'loading' # 'loading' -> 'ready' | 'error', set by warm_up()
+startup_error = None
 
-# KiteApp Setup
+# KiteApp Setup and heavy modules (deferred to warm_up)
 kite = None
 kws = None
-try:
-    with open(ENCTOKEN_FILE, 'r') as rd:
-        enctoken = rd.read().strip()
-    kite = kt.KiteApp(API_KEY,USER_ID,enctoken)
-    kws = kite.kws()
-    print("KiteApp and KWS initialized.")
-except Exception as e:
-    print(f"CRITICAL: Error initializing KiteApp: {e}")
-    traceback.print_exc()
-    exit()
-
-flask_app = Flask(__name__)
+pd = None
+greeks_calculator = None
+get_nifty_weekly_options = None
 
 def initialize_data_and_subscriptions():
     global option_chain_display_data, instrument_details_map, subscribed_tokens_global_list
@@ -148,10 +147,10 @@ def on_ticks(ws, ticks):
                                         current_datetime=current_time_for_greeks,
                                         option_type=greek_calc_option_type
                                     )
-                                    chain_entry['iv'] = calculated_greeks['iv'] if not np.isnan(calculated_greeks['iv']) else None
-                                    chain_entry['delta'] = calculated_greeks['delta'] if not np.isnan(calculated_greeks['delta']) else None
-                                    chain_entry['theta'] = calculated_greeks['theta'] if not np.isnan(calculated_greeks['theta']) else None
-                                    chain_entry['vega'] = calculated_greeks['vega'] if not np.isnan(calculated_greeks['vega']) else None
+                                    chain_entry['iv'] = calculated_greeks['iv'] if not math.isnan(calculated_greeks['iv']) else None
+                                    chain_entry['delta'] = calculated_greeks['delta'] if not math.isnan(calculated_greeks['delta']) else None
+                                    chain_entry['theta'] = calculated_greeks['theta'] if not math.isnan(calculated_greeks['theta']) else None
+                                    chain_entry['vega'] = calculated_greeks['vega'] if not math.isnan(calculated_greeks['vega']) else None
                                 except Exception as e_greek:
                                     chain_entry['iv'] = None; chain_entry['delta'] = None; chain_entry['theta'] = None; chain_entry['vega'] = None;
                             else: # If LTP is None or zero, or spot is None/zero, cannot calculate greeks
@@ -160,6 +159,62 @@ def on_ticks(ws, ticks):
         print(f"Error in on_ticks: {e}")
         traceback.print_exc()
 
+def quotes_to_ticks(quotes):
+    # Reshape REST quotes like ticker ticks; index first so spot is set before the options
+    ticks = [{
+        'instrument_token': quote.get('instrument_token'),
+        'last_price': quote.get('last_price'),
+        'oi': quote.get('oi'),
+        'volume_traded': quote.get('volume')
+    } for quote in quotes.values()]
+    ticks.sort(key=lambda tick: tick['instrument_token'] != NIFTY_INDEX_TOKEN)
+    return ticks
+
+def tokens_to_poll():
+    # Index plus the widest window the page can show around ATM (2 * 101 options), one quote chunk.
+    # Until the spot is known the window can't be placed, so only the index is returned.
+    with data_lock:
+        spot = nifty_spot_ltp
+        strikes = sorted(option_chain_display_data)
+        if spot is None or not strikes:
+            return [NIFTY_INDEX_TOKEN]
+        atm_index = min(range(len(strikes)), key=lambda i: abs(strikes[i] - float(spot)))
+        window = strikes[max(0, atm_index - MAX_STRIKES_EACH_SIDE):atm_index + MAX_STRIKES_EACH_SIDE + 1]
+        tokens = [NIFTY_INDEX_TOKEN]
+        for strike in window:
+            for side in ('call', 'put'):
+                token = option_chain_display_data[strike][side].get('instrument_token')
+                if token is not None:
+                    tokens.append(token)
+    return tokens
+
+def refresh_quotes():
+    global last_quote_refresh_seconds
+    tokens = tokens_to_poll()
+    if len(tokens) == 1:
+        # Spot unknown yet: fetch its price, then the window around it. The window call waits
+        # on the rate limiter behind the spot call, so this cold start isn't timed.
+        on_ticks(None, quotes_to_ticks(kite.ltp_bulk(tokens)))
+        tokens = tokens_to_poll()
+        if len(tokens) > 1:
+            on_ticks(None, quotes_to_ticks(kite.quote_bulk(tokens)))
+        return
+    started = time.perf_counter()
+    on_ticks(None, quotes_to_ticks(kite.quote_bulk(tokens)))
+    last_quote_refresh_seconds = time.perf_counter() - started
+    if last_quote_refresh_seconds > QUOTE_REFRESH_BUDGET:
+        print(f"WARNING: quote refresh took {last_quote_refresh_seconds:.2f}s (budget {QUOTE_REFRESH_BUDGET:.2f}s).")
+
+def poll_quotes():
+    # Fallback when the ticker is unavailable: refresh the displayable chain through bulk REST quotes
+    while True:
+        if not ticker_connected.is_set():
+            try:
+                refresh_quotes()
+            except Exception as e:
+                print(f"Error polling quotes: {e}")
+        sleep(QUOTE_POLL_INTERVAL)
+
 def on_connect(ws, response):
     print(f"WebSocket Connected. Response: {response}")
     global subscribed_tokens_global_list
@@ -167,24 +222,73 @@ def on_connect(ws, response):
         print(f"Subscribing to {len(subscribed_tokens_global_list)} tokens.")
         ws.subscribe(subscribed_tokens_global_list)
         ws.set_mode(ws.MODE_FULL, subscribed_tokens_global_list)
+        # only now will ticks arrive, so REST polling can stop
+        ticker_connected.set()
         print("Subscription and mode set commands sent.")
     else:
         print("No tokens to subscribe to in on_connect.")
 
 def on_close(ws, code, reason):
     print(f"WebSocket Closed. Code: {code}, Reason: {reason}")
+    ticker_connected.clear()
 
 def on_error(ws, code, reason):
+    # no clear here: error frames leave the socket open, and abnormal closes still reach on_close
     print(f"WebSocket Error. Code: {code}, Reason: {reason}")
 
-if kws:
-    kws.on_ticks = on_ticks
-    kws.on_connect = on_connect
-    kws.on_close = on_close
-    kws.on_error = on_error
-else:
-    print("CRITICAL: kws object is None. Cannot assign callbacks.")
-    exit()
+def warm_up():
+    # Slow, fallible startup work; runs in the background while HTTP serves the loading page
+    global kite, kws, app_status, startup_error, pd, greeks_calculator, get_nifty_weekly_options
+    try:
+        import kiteapp as kt
+        import pandas as pd
+        import greeks_calculator
+        from instruments import get_nifty_weekly_options
+        with open(ENCTOKEN_FILE, 'r') as rd:
+            enctoken = rd.read().strip()
+        kite = kt.KiteApp(API_KEY,USER_ID,enctoken)
+        kws = kite.kws()
+        kws.on_ticks = on_ticks
+        kws.on_connect = on_connect
+        kws.on_close = on_close
+        kws.on_error = on_error
+        print("KiteApp and KWS initialized.")
+
+        initialize_data_and_subscriptions()
+        threading.Thread(target=poll_quotes, daemon=True).start()
+        print("Attempting to connect WebSocket...")
+        try:
+            kws.connect(threaded=True)
+        except Exception as e:
+            print(f"Error calling kws.connect(): {e}. Falling back to REST quote polling.")
+        app_status = 'ready'
+    except Exception as e:
+        print(f"CRITICAL: Error initializing KiteApp: {e}")
+        traceback.print_exc()
+        startup_error = str(e)
+        app_status = 'error'
+
+LOADING_HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>NIFTY Option Chain</title>
+    <style>
+        body { font-family: Arial, sans-serif; text-align: center; }
+        .error { color: #c00; }
+    </style>
+    {% if not error %}<meta http-equiv="refresh" content="1">{% endif %}
+</head>
+<body>
+    <h1>NIFTY Option Chain</h1>
+    {% if error %}
+    <h2 class="error">Startup failed: {{ error }}</h2>
+    {% else %}
+    <h2>Loading instruments and connecting...</h2>
+    {% endif %}
+</body>
+</html>
+"""
 
 CHAIN_HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -293,15 +397,17 @@ CHAIN_HTML_TEMPLATE = """
 </html>
 """
 
-@flask_app.route('/')
 def display_option_chain():
+    if app_status != 'ready':
+        return render_template_string(LOADING_HTML_TEMPLATE, error=startup_error)
+
     current_mode = request.args.get('mode', DEFAULT_MODE).lower()
     if current_mode not in ['ltpoi', 'greeks']: 
         current_mode = DEFAULT_MODE
 
     try:
         num_strikes_param = int(request.args.get('strikes_each_side', DEFAULT_NUM_STRIKES_EACH_SIDE))
-        if not (1 <= num_strikes_param <= 50):
+        if not (1 <= num_strikes_param <= MAX_STRIKES_EACH_SIDE):
             num_strikes_param = DEFAULT_NUM_STRIKES_EACH_SIDE
     except ValueError:
         num_strikes_param = DEFAULT_NUM_STRIKES_EACH_SIDE
@@ -362,30 +468,32 @@ def display_option_chain():
                                   current_mode=current_mode,
                                   refresh_interval=refresh_interval)
 
-@flask_app.route('/json_data_chain')
 def get_json_data_chain():
     with data_lock:
         return jsonify({
+            "status": app_status,
+            "last_quote_refresh_seconds": last_quote_refresh_seconds,
             "nifty_spot_ltp": nifty_spot_ltp,
             "option_chain": option_chain_display_data
         })
 
+def create_app(start_warm_up=True):
+    flask_app = Flask(__name__)
+    flask_app.add_url_rule('/', view_func=display_option_chain)
+    flask_app.add_url_rule('/json_data_chain', view_func=get_json_data_chain)
+    if start_warm_up:
+        threading.Thread(target=warm_up, daemon=True).start()
+    return flask_app
+
+IMPORT_TIME = time.perf_counter() - _import_started
+
 if __name__ == '__main__':
     print("Application starting (Option Chain Viewer)...")
-    initialize_data_and_subscriptions()
-    if kws:
-        print("Attempting to connect WebSocket...")
-        try:
-            kws.connect(threaded=True)
-        except Exception as e:
-            print(f"Error calling kws.connect(): {e}")
-            #traceback.print_exc()
-            exit()
-        sleep(3) 
-    else:
-        print("CRITICAL: kws is None. Cannot connect WebSocket.")
-        exit()
+    print(f"app.py imported in {IMPORT_TIME * 1000:.0f} ms (budget {IMPORT_TIME_BUDGET * 1000:.0f} ms).")
+    if IMPORT_TIME > IMPORT_TIME_BUDGET:
+        print("WARNING: import time budget exceeded, check for new module level imports.")
+    flask_app = create_app()
     #print(f"Starting Flask server on http://0.0.0.0:5000")
     #print(f"Default display: {DEFAULT_NUM_STRIKES_EACH_SIDE} strikes on each side of ATM, Mode: {DEFAULT_MODE}.")
     print("Access the option chain at http://127.0.0.1:5000/")
-    flask_app.run(debug=True, host='0.0.0.0', use_reloader=False)
\ No newline at end of file
+    flask_app.run(debug=True, host='0.0.0.0', use_reloader=False)
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.stats import norm
+import math
 import datetime
 
 
@@ -27,6 +27,17 @@ def time_to_expiry_in_years(expiry_datetime, current_datetime):
     t = time_delta.total_seconds() / total_seconds_in_year
     return max(t, 1e-6)
 
+# Standard normal CDF/PDF via math.erfc, keeps scipy off the import path
+SQRT_2 = math.sqrt(2.0)
+SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+def norm_cdf(x):
+    # erfc form avoids the cancellation 1 + erf(x) has in the far left tail
+    return 0.5 * math.erfc(-x / SQRT_2)
+
+def norm_pdf(x):
+    return math.exp(-0.5 * x * x) / SQRT_2PI
+
 # Black-Scholes
 def d1_d2(S, K, T, r, sigma):
     if T <= 0 or sigma <=0:
@@ -49,9 +60,9 @@ def black_scholes_price(S, K, T, r, sigma, option_type="call"):
         else: return max(0, K-S)
 
     if option_type == "call":
-        price = (S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2))
+        price = (S * norm_cdf(d1) - K * np.exp(-r * T) * norm_cdf(d2))
     elif option_type == "put":
-        price = (K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1))
+        price = (K * np.exp(-r * T) * norm_cdf(-d2) - S * norm_cdf(-d1))
     else:
         raise ValueError("option_type must be 'call' or 'put'")
     return price
@@ -65,28 +76,28 @@ def delta(S, K, T, r, sigma, option_type="call"):
     if np.isnan(d1): return np.nan
 
     if option_type == "call":
-        return norm.cdf(d1)
+        return norm_cdf(d1)
     elif option_type == "put":
-        return norm.cdf(d1) - 1
+        return norm_cdf(d1) - 1
     return np.nan
 
 def vega(S, K, T, r, sigma): 
     if T <= 1e-6 or sigma <= 1e-6: return 0.0
     d1, _ = d1_d2(S, K, T, r, sigma)
     if np.isnan(d1): return np.nan
-    return S * norm.pdf(d1) * np.sqrt(T) * 0.01
+    return S * norm_pdf(d1) * np.sqrt(T) * 0.01
 
 def theta(S, K, T, r, sigma, option_type="call"):
     if T <= 1e-6 or sigma <= 1e-6: return 0.0
     d1, d2 = d1_d2(S, K, T, r, sigma)
     if np.isnan(d1): return np.nan
 
-    p1 = - (S * norm.pdf(d1) * sigma) / (2 * np.sqrt(T))
+    p1 = - (S * norm_pdf(d1) * sigma) / (2 * np.sqrt(T))
     if option_type == "call":
-        p2 = r * K * np.exp(-r * T) * norm.cdf(d2)
+        p2 = r * K * np.exp(-r * T) * norm_cdf(d2)
         return (p1 - p2) / 365.25
     elif option_type == "put":
-        p2 = r * K * np.exp(-r * T) * norm.cdf(-d2)
+        p2 = r * K * np.exp(-r * T) * norm_cdf(-d2)
         return (p1 + p2) / 365.25
     return np.nan
 
@@ -98,7 +109,7 @@ def implied_volatility(market_price, S, K, T, r, option_type="call", initial_sig
     sigma = initial_sigma
     for i in range(max_iterations):
         price_at_sigma = black_scholes_price(S, K, T, r, sigma, option_type)
-        vega_at_sigma = S * norm.pdf(d1_d2(S, K, T, r, sigma)[0]) * np.sqrt(T)
+        vega_at_sigma = S * norm_pdf(d1_d2(S, K, T, r, sigma)[0]) * np.sqrt(T)
 
         if vega_at_sigma < 1e-8: 
             if initial_sigma > 0.2:
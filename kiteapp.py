@@ -1,13 +1,48 @@
 import json
 import kiteconnect.exceptions as ex
 import logging,requests
+import threading,time
+from concurrent.futures import ThreadPoolExecutor
 from six.moves.urllib.parse import urljoin
 from kiteconnect import KiteConnect, KiteTicker
 log = logging.getLogger(__name__)
 
+QUOTE_MAX_INSTRUMENTS = 500 # per-call instrument limit of /quote
+LTP_MAX_INSTRUMENTS = 1000 # per-call instrument limit of /quote/ltp
+KITE_HOSTS = 2 # api.kite.trade (instruments) and kite.zerodha.com (oms)
+BULK_MAX_WORKERS = 4
+QUOTE_REQUESTS_PER_SECOND = 1 # Kite's documented quote limit
+QUOTE_BURST = 1 # no burst: two /quote calls in the same second can get a 429
+BULK_RETRIES = 2
+BULK_RETRY_BACKOFF = 1.0 # seconds, doubled on each retry
+
+
+class RateLimiter(object):
+    """Token bucket shared by the bulk quote workers."""
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
 
 class KiteApp(KiteConnect):
-    def __init__(self, api_key, userid, enctoken):
+    def __init__(self, api_key, userid, enctoken, pool=None, max_workers=BULK_MAX_WORKERS,
+                 quote_rate=QUOTE_REQUESTS_PER_SECOND, quote_burst=QUOTE_BURST):
         self.api_key = api_key
         self.user_id = userid
         self.enctoken = enctoken
@@ -16,7 +51,12 @@ class KiteApp(KiteConnect):
             "x-kite-version": "3",
             'Authorization': 'enctoken {}'.format(self.enctoken)
         }
-        KiteConnect.__init__(self, api_key=api_key)
+        self.rate_limiter = RateLimiter(quote_rate, quote_burst)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        # one pool per host, sized so every bulk worker can hold a kept-alive connection
+        if pool is None:
+            pool = {"pool_connections": KITE_HOSTS, "pool_maxsize": max_workers}
+        KiteConnect.__init__(self, api_key=api_key, pool=pool)
 
     def kws(self):
         return KiteTicker(api_key='kitefront', access_token=self.enctoken+"&user_id="+self.user_id, root='wss://ws.kite.trade')
@@ -28,12 +68,9 @@ class KiteApp(KiteConnect):
             uri = self._routes[route].format(**url_args)
         else:
             uri = self._routes[route]
-        if uri.endswith("instruments"):
-            pass
-        else:
-            self.root = self.root2
-        
-        url = self.root+uri# urljoin(self.root, uri)
+        # instruments dump is only served from the public api root, everything else goes through oms
+        root = self.root if uri.endswith("instruments") else self.root2
+        url = root+uri# urljoin(self.root, uri)
         headers = self.headers
         if self.debug:
             log.debug("Request: {method} {url} {params} {headers}".format(method=method, url=url, params=params, headers=headers))
@@ -81,6 +118,49 @@ class KiteApp(KiteConnect):
                 content_type=r.headers["content-type"],
                 content=r.content))
 
+    def _fetch_chunk(self, fetch, chunk):
+        """Fetch one chunk within the rate limit, backing off and retrying on 429 / network errors."""
+        for attempt in range(BULK_RETRIES + 1):
+            self.rate_limiter.acquire()
+            try:
+                return fetch(chunk)
+            except (ex.NetworkException, requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == BULK_RETRIES:
+                    raise
+                log.warning("Retrying chunk of {n} instruments after error: {e}".format(n=len(chunk), e=e))
+                time.sleep(BULK_RETRY_BACKOFF * 2 ** attempt)
+
+    def _bulk(self, fetch, instruments, chunk_size):
+        """Split instruments into API sized chunks and fetch them concurrently within the rate limit.
+
+        Chunks that still fail after retries are logged and left out of the result;
+        the last error is raised only if every chunk failed.
+        """
+        instruments = list(instruments)
+        chunks = [instruments[i:i + chunk_size] for i in range(0, len(instruments), chunk_size)]
+        futures = [self.executor.submit(self._fetch_chunk, fetch, chunk) for chunk in chunks]
+
+        data = {}
+        errors = []
+        for index, future in enumerate(futures):
+            try:
+                data.update(future.result())
+            except Exception as e:
+                errors.append(e)
+                log.error("Chunk {index} ({n} instruments, first {first}) failed: {e}".format(
+                    index=index, n=len(chunks[index]), first=chunks[index][0], e=e))
+        if errors and len(errors) == len(chunks):
+            raise errors[-1]
+        return data
+
+    def quote_bulk(self, instruments):
+        """Full quotes for any number of instruments (tokens or exchange:tradingsymbol)."""
+        return self._bulk(self.quote, instruments, QUOTE_MAX_INSTRUMENTS)
+
+    def ltp_bulk(self, instruments):
+        """Last traded prices for any number of instruments (tokens or exchange:tradingsymbol)."""
+        return self._bulk(self.ltp, instruments, LTP_MAX_INSTRUMENTS)
+
 def login_with_credentials(userid, password, twofa):
     reqsession = requests.Session()
     r = reqsession.post('https://kite.zerodha.com/api/login', data={
@@ -0,0 +1,160 @@
+import datetime
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import app
+
+
+def test_quotes_to_ticks_maps_fields_and_puts_index_first():
+    quotes = {
+        "12345": {"instrument_token": 12345, "last_price": 101.5, "oi": 900, "volume": 42},
+        "256265": {"instrument_token": app.NIFTY_INDEX_TOKEN, "last_price": 24000.0},
+    }
+    ticks = app.quotes_to_ticks(quotes)
+    assert ticks[0]["instrument_token"] == app.NIFTY_INDEX_TOKEN
+    assert ticks[1] == {"instrument_token": 12345, "last_price": 101.5, "oi": 900, "volume_traded": 42}
+
+
+def test_tokens_to_poll_fits_one_quote_chunk(monkeypatch):
+    chain = {}
+    for i in range(900):
+        strike = 10000 + 50 * i
+        chain[strike] = {'call': {'instrument_token': 2 * i + 1}, 'put': {'instrument_token': 2 * i + 2}}
+    monkeypatch.setattr(app, "option_chain_display_data", chain)
+
+    monkeypatch.setattr(app, "nifty_spot_ltp", None)
+    assert app.tokens_to_poll() == [app.NIFTY_INDEX_TOKEN]
+
+    monkeypatch.setattr(app, "nifty_spot_ltp", 30010.0)
+    tokens = app.tokens_to_poll()
+    assert tokens[0] == app.NIFTY_INDEX_TOKEN
+    assert len(tokens) == 1 + 2 * (2 * app.MAX_STRIKES_EACH_SIDE + 1)
+    assert len(tokens) <= 500 # kiteapp.QUOTE_MAX_INSTRUMENTS
+
+
+
+class FakeKite(object):
+    def __init__(self):
+        self.calls = []
+
+    def _respond(self, kind, tokens):
+        self.calls.append((kind, list(tokens)))
+        return {str(token): {"instrument_token": token, "last_price": 24000.0 if token == app.NIFTY_INDEX_TOKEN else 100.0,
+                             "oi": 10, "volume": 5} for token in tokens}
+
+    def ltp_bulk(self, tokens):
+        return self._respond("ltp", tokens)
+
+    def quote_bulk(self, tokens):
+        return self._respond("quote", tokens)
+
+
+class FakeWs(object):
+    MODE_FULL = "full"
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def subscribe(self, tokens):
+        if self.fail:
+            raise RuntimeError("subscribe failed")
+
+    def set_mode(self, mode, tokens):
+        pass
+
+
+class StopPolling(Exception):
+    pass
+
+
+@pytest.fixture
+def chain(monkeypatch):
+    import greeks_calculator
+    expiry = datetime.datetime.now() + datetime.timedelta(days=7)
+    chain_data, details = {}, {}
+    for i, strike in enumerate(range(23800, 24250, 50)):
+        call, put = 2 * i + 1, 2 * i + 2
+        chain_data[strike] = {'strike': strike, 'call': {'instrument_token': call}, 'put': {'instrument_token': put}}
+        details[call] = {'strike': strike, 'type': 'CE', 'expiry_datetime': expiry}
+        details[put] = {'strike': strike, 'type': 'PE', 'expiry_datetime': expiry}
+    monkeypatch.setattr(app, "option_chain_display_data", chain_data)
+    monkeypatch.setattr(app, "instrument_details_map", details)
+    monkeypatch.setattr(app, "subscribed_tokens_global_list", list(details) + [app.NIFTY_INDEX_TOKEN])
+    monkeypatch.setattr(app, "nifty_spot_ltp", None)
+    monkeypatch.setattr(app, "last_quote_refresh_seconds", None)
+    monkeypatch.setattr(app, "greeks_calculator", greeks_calculator)
+    monkeypatch.setattr(app, "kite", FakeKite())
+    app.ticker_connected.clear()
+    yield chain_data
+    app.ticker_connected.clear()
+
+
+def test_refresh_quotes_cold_start_fetches_spot_then_window(chain):
+    app.refresh_quotes()
+    assert app.kite.calls[0] == ("ltp", [app.NIFTY_INDEX_TOKEN])
+    kind, tokens = app.kite.calls[1]
+    assert kind == "quote" and tokens[0] == app.NIFTY_INDEX_TOKEN and len(tokens) == 1 + 2 * len(chain)
+    assert app.nifty_spot_ltp == 24000.0
+    assert chain[24000]['call']['ltp'] == 100.0 and chain[24000]['call']['volume'] == 5
+    assert app.last_quote_refresh_seconds is None # cold start isn't timed
+
+    app.refresh_quotes()
+    assert [kind for kind, _ in app.kite.calls] == ["ltp", "quote", "quote"]
+    assert app.last_quote_refresh_seconds is not None
+
+
+def test_poll_quotes_only_refreshes_while_ticker_is_down(chain, monkeypatch):
+    refreshes = []
+    monkeypatch.setattr(app, "refresh_quotes", lambda: refreshes.append(1))
+
+    def stop(seconds):
+        raise StopPolling()
+    monkeypatch.setattr(app, "sleep", stop)
+
+    app.ticker_connected.set()
+    with pytest.raises(StopPolling):
+        app.poll_quotes()
+    assert refreshes == []
+
+    app.ticker_connected.clear()
+    with pytest.raises(StopPolling):
+        app.poll_quotes()
+    assert refreshes == [1]
+
+
+def test_ticker_callbacks_toggle_polling(chain):
+    with pytest.raises(RuntimeError):
+        app.on_connect(FakeWs(fail=True), {})
+    assert not app.ticker_connected.is_set()
+
+    app.on_connect(FakeWs(), {})
+    assert app.ticker_connected.is_set()
+
+    # error frames keep the socket open, so polling stays off until on_close
+    app.on_error(FakeWs(), 0, "error frame")
+    assert app.ticker_connected.is_set()
+
+    app.on_close(FakeWs(), 1006, "abnormal")
+    assert not app.ticker_connected.is_set()
+
+
+# run in a fresh interpreter so nothing imported by other tests leaks into sys.modules
+IMPORT_CHECK = """
+import json, sys
+import app
+status = app.create_app(start_warm_up=False).test_client().get('/json_data_chain').get_json()['status']
+heavy = [name for name in ('pandas', 'numpy', 'kiteconnect', 'greeks_calculator') if name in sys.modules]
+print(json.dumps({'import_time': app.IMPORT_TIME, 'budget': app.IMPORT_TIME_BUDGET, 'heavy': heavy, 'status': status}))
+"""
+
+def test_import_is_fast_and_light():
+    out = subprocess.run([sys.executable, "-c", IMPORT_CHECK], capture_output=True, text=True, check=True,
+                         cwd=os.path.dirname(os.path.abspath(__file__)))
+    result = json.loads(out.stdout.splitlines()[-1])
+    assert result['import_time'] < result['budget']
+    assert result['heavy'] == []
+    assert result['status'] == 'loading'
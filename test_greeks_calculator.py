@@ -0,0 +1,29 @@
+import datetime
+from statistics import NormalDist
+
+import pytest
+
+import greeks_calculator as gc
+
+
+@pytest.mark.parametrize("x", [-3.0, -1.5, -0.4, 0.0, 0.4, 1.96, 5.0, 10.0])
+def test_norm_matches_statistics(x):
+    normal = NormalDist()
+    assert gc.norm_cdf(x) == pytest.approx(normal.cdf(x), rel=1e-12)
+    assert gc.norm_pdf(x) == pytest.approx(normal.pdf(x), rel=1e-12)
+
+
+# NormalDist.cdf uses 1 + erf and loses precision out here, so compare with tabulated values
+@pytest.mark.parametrize("x, expected", [(-5.0, 2.866515718791939e-07), (-10.0, 7.619853024160527e-24)])
+def test_norm_cdf_left_tail(x, expected):
+    assert gc.norm_cdf(x) == pytest.approx(expected, rel=1e-12)
+
+
+def test_calculate_all_greeks_known_option():
+    # ATM call, one year out, r = 6%, sigma = 20%: d1 = 0.4, d2 = 0.2
+    expiry = datetime.datetime(2026, 1, 1)
+    now = datetime.datetime(2026, 1, 1, 15, 30) - datetime.timedelta(days=365.25)
+    greeks = gc.calculate_all_greeks(10.989549, 100, 100, expiry, now, option_type="call")
+    assert greeks['iv'] == pytest.approx(0.2, abs=1e-5)
+    assert greeks['delta'] == pytest.approx(NormalDist().cdf(0.4), abs=1e-5)
+    assert greeks['vega'] == pytest.approx(100 * NormalDist().pdf(0.4) * 0.01, abs=1e-5)
@@ -0,0 +1,126 @@
+import time
+
+import kiteconnect.exceptions as ex
+import pytest
+
+import kiteapp as kt
+
+
+@pytest.fixture
+def kite(monkeypatch):
+    monkeypatch.setattr(kt, "BULK_RETRY_BACKOFF", 0)
+    # a fast limiter so the chunking tests don't wait on the real 1 req/s
+    return kt.KiteApp("kite", "ABC012", "token", quote_rate=1000, quote_burst=1000)
+
+
+def echo_fetch(calls):
+    def fetch(chunk):
+        calls.append(list(chunk))
+        return {str(token): {"instrument_token": token} for token in chunk}
+    return fetch
+
+
+@pytest.mark.parametrize("chunk_size", [kt.QUOTE_MAX_INSTRUMENTS, kt.LTP_MAX_INSTRUMENTS])
+def test_bulk_chunks_and_merges(kite, chunk_size):
+    calls = []
+    instruments = list(range(2 * chunk_size + 1))
+    data = kite._bulk(echo_fetch(calls), instruments, chunk_size)
+    assert sorted(len(chunk) for chunk in calls) == [1, chunk_size, chunk_size]
+    assert len(data) == len(instruments)
+
+
+def test_quote_and_ltp_bulk_use_api_limits(kite, monkeypatch):
+    calls = []
+    monkeypatch.setattr(kite, "quote", echo_fetch(calls))
+    kite.quote_bulk(range(kt.QUOTE_MAX_INSTRUMENTS + 1))
+    assert max(len(chunk) for chunk in calls) == kt.QUOTE_MAX_INSTRUMENTS
+
+    calls.clear()
+    monkeypatch.setattr(kite, "ltp", echo_fetch(calls))
+    kite.ltp_bulk(range(kt.LTP_MAX_INSTRUMENTS + 1))
+    assert max(len(chunk) for chunk in calls) == kt.LTP_MAX_INSTRUMENTS
+
+
+def test_bulk_keeps_partial_results_when_a_chunk_fails(kite):
+    def fetch(chunk):
+        if chunk[0] == 10:
+            raise ex.GeneralException("boom")
+        return {str(token): {} for token in chunk}
+
+    data = kite._bulk(fetch, range(20), 10)
+    assert sorted(data, key=int) == [str(token) for token in range(10)]
+
+
+def test_bulk_retries_network_errors(kite):
+    attempts = []
+
+    def fetch(chunk):
+        attempts.append(chunk)
+        if len(attempts) == 1:
+            raise ex.NetworkException("Too many requests", code=429)
+        return {"256265": {}}
+
+    assert kite._bulk(fetch, [256265], 10) == {"256265": {}}
+    assert len(attempts) == 2
+
+
+def test_bulk_raises_when_every_chunk_fails(kite):
+    def fetch(chunk):
+        raise ex.NetworkException("Too many requests", code=429)
+
+    with pytest.raises(ex.NetworkException):
+        kite._bulk(fetch, range(20), 10)
+
+
+def test_bulk_window_refresh_within_budget():
+    # one /quote chunk at the real rate limit, with a slow server
+    kite = kt.KiteApp("kite", "ABC012", "token")
+
+    def fetch(chunk):
+        time.sleep(0.2)
+        return {str(token): {} for token in chunk}
+
+    started = time.perf_counter()
+    kite._bulk(fetch, range(kt.QUOTE_MAX_INSTRUMENTS), kt.QUOTE_MAX_INSTRUMENTS)
+    assert time.perf_counter() - started < 1.0
+
+
+def test_rate_limiter_spacing():
+    limiter = kt.RateLimiter(rate=20, burst=1)
+    started = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    # first call is free, the other four wait 1/20 s each
+    assert time.monotonic() - started >= 4 / 20 * 0.9
+
+
+class FakeResponse(object):
+    status_code = 200
+    headers = {"content-type": "application/json"}
+    content = b'{"status": "success", "data": {}}'
+
+
+class FakeSession(object):
+    def __init__(self):
+        self.urls = []
+
+    def request(self, method, url, **kwargs):
+        self.urls.append(url)
+        return FakeResponse()
+
+
+def test_request_root_choice(kite):
+    root = kite.root
+    kite.reqsession = FakeSession()
+    kite._request("market.quote", "GET", params={"i": [256265]})
+    kite._request("market.instruments.all", "GET")
+    assert kite.reqsession.urls[0].startswith(kite.root2)
+    assert kite.reqsession.urls[1] == root + "/instruments"
+    assert kite.root == root
+
+
+def test_pool_sized_to_workers():
+    kite = kt.KiteApp("kite", "ABC012", "token", max_workers=6)
+    adapter = kite.reqsession.get_adapter("https://kite.zerodha.com/oms")
+    assert adapter._pool_connections == kt.KITE_HOSTS
+    assert adapter._pool_maxsize == 6